@@ -1,15 +1,98 @@
+import os
 import sys
 import json
+import time
+import sqlite3
 import asyncio
+from contextlib import closing
+from functools import lru_cache
 from howlongtobeatpy import HowLongToBeat
 
-async def list_commands(game_name):
-    hltb = HowLongToBeat()
+try:
+    import orjson
+
+    def dumps(obj):
+        return orjson.dumps(obj)
+except ImportError:  # orjson is optional, fall back to the stdlib encoder
+    def dumps(obj):
+        return json.dumps(obj).encode()
+
+def emit(obj):
+    # Write encoded JSON lines straight to the binary stdout buffer
+    sys.stdout.buffer.write(dumps(obj) + b"\n")
+
+# Run searches on uvloop where available, the default asyncio loop otherwise
+run = asyncio.run
+if sys.platform != "win32":
+    try:
+        import uvloop
+        # uvloop.run was added in uvloop 0.18
+        run = getattr(uvloop, "run", asyncio.run)
+    except ImportError:
+        pass
+
+# Search results are memoized on disk so repeated lookups skip the network.
+# SQLite in WAL mode is safe with many bridge processes running at once.
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "hltb")
+CACHE_FILE = os.path.join(CACHE_DIR, "search_cache.sqlite3")
+CACHE_TTL = 7 * 24 * 60 * 60  # seconds
+CACHE_TIMEOUT = 5  # seconds to wait for a concurrent writer
+
+def normalize_name(game_name):
+    return game_name.strip().casefold()
+
+class Query(str):
+    # Compares and hashes as the normalized name, so caches dedupe on it,
+    # while keeping the title as typed for the search itself (HLTB scores
+    # similarity case-sensitively)
+    def __new__(cls, game_name):
+        query = super().__new__(cls, normalize_name(game_name))
+        query.title = game_name
+        return query
+
+def open_cache():
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    conn = sqlite3.connect(CACHE_FILE, timeout=CACHE_TIMEOUT)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS search ("
+        "key TEXT PRIMARY KEY, timestamp REAL NOT NULL, output TEXT NOT NULL)"
+    )
+    return conn
+
+def read_cache(keys):
+    # Any cache failure just means an uncached search
+    try:
+        with closing(open_cache()) as conn:
+            found = {}
+            for key in keys:
+                row = conn.execute(
+                    "SELECT output FROM search WHERE key = ? AND timestamp > ?",
+                    (key, time.time() - CACHE_TTL)
+                ).fetchone()
+                if row is not None:
+                    found[key] = json.loads(row[0])
+            return found
+    except (OSError, sqlite3.Error, ValueError):
+        return {}
+
+def write_cache(outputs):
+    # Only cache real matches so a transient miss is retried next time
+    rows = [(key, time.time(), json.dumps(output)) for key, output in outputs.items() if "error" not in output]
+    if not rows:
+        return
+    try:
+        with closing(open_cache()) as conn, conn:
+            conn.executemany("INSERT OR REPLACE INTO search VALUES (?, ?, ?)", rows)
+    except (OSError, sqlite3.Error):
+        pass
+
+async def search_game(hltb, game_name):
     results = await hltb.async_search(game_name)
-    
+
     if results is not None and len(results) > 0:
         best_match = results[0]
-        output = {
+        return {
             "name": best_match.game_name,
             "main_story": best_match.main_story,
             "main_extra": best_match.main_extra,
@@ -17,14 +100,64 @@ async def list_commands(game_name):
             "all_styles": best_match.all_styles,
             "similarity": best_match.similarity
         }
-        print(json.dumps(output))
-    else:
-        print(json.dumps({"error": "Not found"}))
+    return {"error": "Not found"}
+
+async def search_many(names):
+    # One client for the whole batch so its HTTP connections are reused
+    hltb = HowLongToBeat()
+    results = await asyncio.gather(*(search_game(hltb, name) for name in names), return_exceptions=True)
+    # A failed search only affects its own record
+    return [{"error": f"Search failed: {result}"} if isinstance(result, Exception) else result
+            for result in results]
+
+@lru_cache(maxsize=512)
+def lookup_game(query):
+    key = str(query)
+    output = read_cache([key]).get(key)
+    if output is not None:
+        return output
+
+    output = run(search_game(HowLongToBeat(), query.title))
+    write_cache({key: output})
+    return output
+
+def list_commands(game_name):
+    try:
+        output = lookup_game(Query(game_name))
+    except Exception as exc:
+        # Same error record as a failed search in batch mode
+        output = {"error": f"Search failed: {exc}"}
+    emit(output)
+
+def main_batch(names):
+    keys = [normalize_name(name) for name in names]
+
+    found = read_cache(dict.fromkeys(keys))
+    # Search each uncached key once, under the first title it was given as
+    found[""] = {"error": "No game name provided"}
+    missing = {}
+    for key, name in zip(keys, names):
+        if key not in found:
+            missing.setdefault(key, name)
+    if missing:
+        searched = dict(zip(missing, run(search_many(missing.values()))))
+        write_cache(searched)
+        found.update(searched)
+
+    # One JSON object per input line, in input order
+    for key in keys:
+        emit(found[key])
 
 if __name__ == "__main__":
     if len(sys.argv) < 2:
-        print(json.dumps({"error": "No game name provided"}))
+        emit({"error": "No game name provided"})
+        sys.stdout.buffer.flush()
         sys.exit(1)
-        
-    game_name = sys.argv[1]
-    asyncio.run(list_commands(game_name))
+
+    if sys.argv[1] == "-":
+        # Batch mode: one game name per stdin line, JSONL on stdout
+        # Blank lines get an error record so output stays aligned with input
+        main_batch(sys.stdin.read().splitlines())
+    else:
+        list_commands(sys.argv[1])
+    sys.stdout.buffer.flush()
@@ -11,14 +11,47 @@ Usage:
         user_hardware={...},
         game_requirements={...}
     )
+
+The module type-checks cleanly under mypy, so it can be compiled ahead of
+time with mypyc; the resulting extension is imported in place of the .py:
+    cd scripts && mypyc pc_specs_checker.py
+Only compile this module: the numba kernel in pc_specs_kernels.py must stay
+plain Python for njit to work.
 """
 
+import re
 import json
-from typing import Dict, Any
+from array import array
+from bisect import bisect_left, bisect_right
+from functools import lru_cache
+from typing import Dict, Any, Final, Iterable, List, Mapping, NamedTuple, Optional, Sequence, Tuple, TypedDict
+
+try:
+    import orjson
+except ImportError:  # orjson is optional, json is used for output otherwise
+    orjson = None  # type: ignore[assignment]
+
+try:
+    import numpy as np
+except ImportError:  # numpy is only needed for check_many
+    np = None  # type: ignore[assignment]
+
+try:
+    # Kept in its own module: numba's njit cannot wrap mypyc-compiled functions
+    from pc_specs_kernels import check_many_nb as _check_many_nb
+    HAVE_NUMBA = True
+except ImportError:  # optional JIT backend for check_many (needs numba)
+    HAVE_NUMBA = False
+
+try:
+    from rapidfuzz import fuzz, process, utils
+    HAVE_RAPIDFUZZ = True
+except ImportError:  # optional fuzzy matching for names missing from the DBs
+    HAVE_RAPIDFUZZ = False
 
 # Placeholder benchmark database for CPU scores
 # Higher score = better performance
-CPU_BENCHMARK_DB = {
+CPU_BENCHMARK_DB: Final[Mapping[str, int]] = {
     # Intel CPUs
     "Intel Core i9-13900K": 45000,
     "Intel Core i7-13700K": 38000,
@@ -47,7 +80,7 @@ CPU_BENCHMARK_DB = {
 
 # Placeholder benchmark database for GPU scores
 # Higher score = better performance (based on approximate 3DMark scores)
-GPU_BENCHMARK_DB = {
+GPU_BENCHMARK_DB: Final[Mapping[str, int]] = {
     # NVIDIA RTX 40 Series
     "NVIDIA GeForce RTX 4090": 35000,
     "NVIDIA GeForce RTX 4080": 28000,
@@ -82,7 +115,123 @@ GPU_BENCHMARK_DB = {
 }
 
 
-def get_cpu_score(cpu_name: str, cores: int = None, clock_speed: float = None) -> int:
+def _normalize_name(name: str) -> str:
+    """Normalize a hardware name for lookup (case, spacing, trademark marks)."""
+    name = re.sub(r"\(r\)|\(tm\)|[\u00ae\u2122]", "", name.lower())
+    return re.sub(r"\s+", " ", name).strip()
+
+
+def _build_table(db: Mapping[str, int]) -> Tuple[Tuple[str, ...], "array[int]"]:
+    """Split a DB into sorted normalized names and a parallel array of scores."""
+    items = sorted((_normalize_name(name), score) for name, score in db.items())
+    return tuple(name for name, _ in items), array("i", (score for _, score in items))
+
+
+def _table_get(keys: Tuple[str, ...], values: "array[int]", key: str) -> int:
+    """Binary-search a table built by _build_table; -1 if key is missing."""
+    i = bisect_left(keys, key)
+    if i < len(keys) and keys[i] == key:
+        return values[i]
+    return -1
+
+
+# Lookup tables keyed by normalized name, built once at import
+_CPU_KEYS, _CPU_VALS = _build_table(CPU_BENCHMARK_DB)
+_GPU_KEYS, _GPU_VALS = _build_table(GPU_BENCHMARK_DB)
+
+
+# A model is its series token, 3-5 digit number and variant words, e.g.
+# ("rx", "7900", "xt"), ("i5", "10400", ""), ("ryzen 5", "5600", "");
+# desktop suffix letters (k/x/f) after the number are not part of it
+_MODEL_RE: Final = re.compile(
+    r"\b(ryzen \d|[a-z]+\d*)[\s-](\d{3,5})([a-z]*)((?: (?:ti|super|xtx|xt))*)\b"
+)
+
+# Laptop parts share model numbers with desktop ones but are much slower
+_MOBILE_RE: Final = re.compile(r"\b(?:laptop|mobile|notebook|max-q)\b")
+_MOBILE_SUFFIXES: Final = frozenset(("m", "u", "h", "hs", "hx", "p"))
+
+# Extra text operating systems add to reported names
+_NAME_NOISE_RE: Final = re.compile(
+    r"@.*$"                        # "@ 2.90ghz"
+    r"|\b\d+-core processor\b"     # "6-core processor"
+    r"|\b\d+(?:st|nd|rd|th) gen\b"  # "12th gen"
+    r"|\b(?:cpu|gpu|processor)\b"
+)
+
+
+def _model_keys(name: str) -> List[Tuple[str, str, str]]:
+    """Return the models named in a normalized name; none for mobile parts."""
+    if _MOBILE_RE.search(name):
+        return []
+    keys = []
+    for series, number, suffix, variant in _MODEL_RE.findall(name):
+        if suffix in _MOBILE_SUFFIXES:
+            return []
+        keys.append((series, number, variant.strip()))
+    return keys
+
+
+def _group_by_model(names: Iterable[str]) -> Dict[Tuple[str, str, str], List[str]]:
+    """Group normalized names by each model they contain."""
+    groups: Dict[Tuple[str, str, str], List[str]] = {}
+    for name in names:
+        for model in _model_keys(name):
+            groups.setdefault(model, []).append(name)
+    return groups
+
+
+# Fuzzy matching only considers entries of the same model, so e.g. an
+# RTX 2080 is never scored as an RTX 4080, a Radeon HD 7900 as an RX 7900 XT,
+# or an RTX 3060 Laptop GPU as the desktop card
+_CPU_BY_MODEL: Final = _group_by_model(_CPU_KEYS)
+_GPU_BY_MODEL: Final = _group_by_model(_GPU_KEYS)
+
+
+def _fuzzy_lookup(name: str, keys: Tuple[str, ...], values: "array[int]",
+                  by_model: Dict[Tuple[str, str, str], List[str]]) -> int:
+    """Return the score of the closest DB entry for a normalized name, or -1."""
+    if not HAVE_RAPIDFUZZ:
+        return -1
+    name = " ".join(_NAME_NOISE_RE.sub(" ", name).split())
+    candidates = list(dict.fromkeys(
+        candidate for model in _model_keys(name) for candidate in by_model.get(model, ())
+    ))
+    if not candidates:
+        return -1
+    # default_process ignores punctuation ("i5 12600k" vs "i5-12600k")
+    match = process.extractOne(name, candidates, scorer=fuzz.WRatio, processor=utils.default_process,
+                               score_cutoff=85)
+    if match is None:
+        return -1
+    return _table_get(keys, values, match[0])
+
+
+def cpu_lookup(cpu_name: str) -> int:
+    """Return the benchmark score for a known (or closely matching) CPU, or -1."""
+    key = _normalize_name(cpu_name)
+    score = _table_get(_CPU_KEYS, _CPU_VALS, key)
+    if score < 0:
+        score = _fuzzy_lookup(key, _CPU_KEYS, _CPU_VALS, _CPU_BY_MODEL)
+    return score
+
+
+def gpu_lookup(gpu_name: str) -> int:
+    """Return the benchmark score for a known (or closely matching) GPU, or -1."""
+    key = _normalize_name(gpu_name)
+    score = _table_get(_GPU_KEYS, _GPU_VALS, key)
+    if score < 0:
+        score = _fuzzy_lookup(key, _GPU_KEYS, _GPU_VALS, _GPU_BY_MODEL)
+    return score
+
+
+# VRAM fallback for unknown GPUs: _VRAM_SCORES[i] applies from _VRAM_TIERS[i - 1] GB up
+_VRAM_TIERS: Final = (4, 6, 8, 12, 16)
+_VRAM_SCORES: Final = (3000, 6000, 9000, 12000, 15000, 20000)
+
+
+@lru_cache(maxsize=1024)
+def get_cpu_score(cpu_name: str, cores: Optional[int] = None, clock_speed: Optional[float] = None) -> int:
     """
     Get benchmark score for a CPU.
     
@@ -95,8 +244,9 @@ def get_cpu_score(cpu_name: str, cores: int = None, clock_speed: float = None) -
         Benchmark score (integer)
     """
     # Check if CPU exists in database
-    if cpu_name in CPU_BENCHMARK_DB:
-        return CPU_BENCHMARK_DB[cpu_name]
+    score = cpu_lookup(cpu_name)
+    if score >= 0:
+        return score
     
     # Fallback: estimate based on cores and clock speed if provided
     if cores and clock_speed:
@@ -108,7 +258,8 @@ def get_cpu_score(cpu_name: str, cores: int = None, clock_speed: float = None) -
     return 10000
 
 
-def get_gpu_score(gpu_name: str, vram_gb: int = None) -> int:
+@lru_cache(maxsize=1024)
+def get_gpu_score(gpu_name: str, vram_gb: Optional[int] = None) -> int:
     """
     Get benchmark score for a GPU.
     
@@ -120,30 +271,163 @@ def get_gpu_score(gpu_name: str, vram_gb: int = None) -> int:
         Benchmark score (integer)
     """
     # Check if GPU exists in database
-    if gpu_name in GPU_BENCHMARK_DB:
-        return GPU_BENCHMARK_DB[gpu_name]
+    score = gpu_lookup(gpu_name)
+    if score >= 0:
+        return score
     
     # Fallback: rough estimation based on VRAM if provided
     if vram_gb:
         # Rough estimation (not accurate)
-        if vram_gb >= 16:
-            return 20000
-        elif vram_gb >= 12:
-            return 15000
-        elif vram_gb >= 8:
-            return 12000
-        elif vram_gb >= 6:
-            return 9000
-        elif vram_gb >= 4:
-            return 6000
-        else:
-            return 3000
+        return _VRAM_SCORES[bisect_right(_VRAM_TIERS, vram_gb)]
     
     # Default fallback for unknown GPUs
     return 8000
 
 
-def check_game_compatibility(user_hardware: Dict[str, Any], game_requirements: Dict[str, Any]) -> Dict[str, Any]:
+class CpuSpec(TypedDict, total=False):
+    name: str  # required unless score is given
+    cores: int
+    clock_speed: float  # GHz
+    score: int
+
+
+class GpuSpec(TypedDict, total=False):
+    name: str  # required unless score is given
+    vram_gb: int
+    score: int
+
+
+class UserHardware(TypedDict):
+    cpu: CpuSpec
+    gpu: GpuSpec
+    ram_gb: int
+
+
+class RequirementTier(TypedDict):
+    cpu_score: int
+    gpu_score: int
+    ram_gb: int
+
+
+class GameRequirements(TypedDict):
+    minimum: RequirementTier
+    recommended: RequirementTier
+
+
+class HardwareScores(NamedTuple):
+    """Resolved benchmark scores for a user's hardware."""
+    cpu_score: int
+    gpu_score: int
+    ram_gb: int
+
+    @classmethod
+    def from_dict(cls, user_hardware: UserHardware) -> "HardwareScores":
+        """Build from a user_hardware dict, estimating missing scores."""
+        cpu = user_hardware["cpu"]
+        cpu_score = cpu.get("score")
+        if cpu_score is None:
+            cpu_score = get_cpu_score(cpu["name"], cpu.get("cores"), cpu.get("clock_speed"))
+        
+        gpu = user_hardware["gpu"]
+        gpu_score = gpu.get("score")
+        if gpu_score is None:
+            gpu_score = get_gpu_score(gpu["name"], gpu.get("vram_gb"))
+        
+        return cls(cpu_score, gpu_score, user_hardware["ram_gb"])
+
+
+class Requirements(NamedTuple):
+    """One tier (minimum or recommended) of game requirements."""
+    cpu_score: int
+    gpu_score: int
+    ram_gb: int
+
+    @classmethod
+    def from_dict(cls, reqs: RequirementTier) -> "Requirements":
+        """Build from a {"cpu_score", "gpu_score", "ram_gb"} dict."""
+        return cls(reqs["cpu_score"], reqs["gpu_score"], reqs["ram_gb"])
+
+
+class Details(NamedTuple):
+    """Per-component requirement checks of a compatibility result."""
+    cpu_meets_min: bool
+    cpu_meets_rec: bool
+    gpu_meets_min: bool
+    gpu_meets_rec: bool
+    ram_meets_min: bool
+    ram_meets_rec: bool
+    user_scores: HardwareScores
+
+    def to_dict(self) -> Dict[str, Any]:
+        details = self._asdict()
+        details["user_scores"] = {
+            "cpu": self.user_scores.cpu_score,
+            "gpu": self.user_scores.gpu_score,
+            "ram": self.user_scores.ram_gb
+        }
+        return details
+
+
+class Result(NamedTuple):
+    """Compatibility result returned by check_game_compatibility."""
+    can_run: bool
+    settings: str
+    notes: str
+    details: Details
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the result as the nested dictionary used for JSON output."""
+        result = self._asdict()
+        result["details"] = self.details.to_dict()
+        return result
+
+
+def to_json(result: Result, indent: bool = False) -> str:
+    """Serialize a Result to JSON (orjson when installed)."""
+    if orjson is not None:
+        return orjson.dumps(result.to_dict(), option=orjson.OPT_INDENT_2 if indent else 0).decode()
+    return json.dumps(result.to_dict(), indent=2 if indent else None)
+
+
+# Static result notes, shared by every call
+_HIGH_NOTES: Final = "Your hardware meets or exceeds recommended requirements. Enjoy high settings!"
+_MED_NOTES: Final = "Your hardware is between minimum and recommended. Expect medium settings."
+_LOW_NOTES: Final = "Your hardware meets minimum requirements. Expect low settings for smooth gameplay."
+
+
+def _gap(value: int, minimum: int, recommended: int) -> float:
+    """
+    How far value is from minimum towards recommended (0.0 = minimum,
+    1.0 = recommended). A zero-width range is always met, so it counts as 1.0.
+    """
+    denom = recommended - minimum
+    return (value - minimum) / denom if denom else 1.0
+
+
+def _build_bottleneck_table() -> Tuple[Tuple[str, ...], ...]:
+    """
+    Precompute the bottleneck note templates for every combination of the
+    three minimum requirement checks, packed as a bit mask:
+        bit 0/1/2: cpu/gpu/ram meet minimum
+    Templates are formatted with (hardware scores, minimum requirements).
+    An empty entry means every minimum is met. Hardware meeting every
+    requirement returns "High" before this table is used.
+    """
+    templates = (
+        "CPU (yours: {0.cpu_score}, need: {1.cpu_score})",
+        "GPU (yours: {0.gpu_score}, need: {1.gpu_score})",
+        "RAM (yours: {0.ram_gb}GB, need: {1.ram_gb}GB)",
+    )
+    return tuple(
+        tuple(template for bit, template in enumerate(templates) if not mask >> bit & 1)
+        for mask in range(8)
+    )
+
+
+_BOTTLENECK_TABLE: Final = _build_bottleneck_table()
+
+
+def check_game_compatibility(user_hardware: UserHardware, game_requirements: GameRequirements) -> "Result":
     """
     Check if user hardware can run a game based on requirements.
     
@@ -179,150 +463,138 @@ def check_game_compatibility(user_hardware: Dict[str, Any], game_requirements: D
             }
     
     Returns:
-        Dictionary with compatibility result:
-            {
-                "can_run": bool (True/False),
-                "settings": str ("Cannot Run", "Low", "Medium", "High"),
-                "notes": str (explanation),
-                "details": {
-                    "cpu_meets_min": bool,
-                    "cpu_meets_rec": bool,
-                    "gpu_meets_min": bool,
-                    "gpu_meets_rec": bool,
-                    "ram_meets_min": bool,
-                    "ram_meets_rec": bool
-                }
-            }
+        Result namedtuple with compatibility result:
+            can_run: bool (True/False)
+            settings: str ("Cannot Run", "Low", "Medium", "High")
+            notes: str (explanation)
+            details: Details namedtuple
+                cpu_meets_min, cpu_meets_rec,
+                gpu_meets_min, gpu_meets_rec,
+                ram_meets_min, ram_meets_rec: bool
+                user_scores: HardwareScores
+        Use result.to_dict() or to_json(result) for the dictionary form.
+    
+    Settings precedence (shared by check_many):
+        1. "Cannot Run" if any minimum requirement is not met
+        2. "High" if every recommended requirement is met
+        3. otherwise "Medium" or "Low" by the average gap to recommended
+    This holds even for data where a recommended value is below the minimum.
     """
     
     # Step 1: Extract user hardware scores
-    user_cpu_score = user_hardware["cpu"].get("score")
-    if user_cpu_score is None:
-        user_cpu_score = get_cpu_score(
-            user_hardware["cpu"]["name"],
-            user_hardware["cpu"].get("cores"),
-            user_hardware["cpu"].get("clock_speed")
-        )
+    hw = HardwareScores.from_dict(user_hardware)
     
-    user_gpu_score = user_hardware["gpu"].get("score")
-    if user_gpu_score is None:
-        user_gpu_score = get_gpu_score(
-            user_hardware["gpu"]["name"],
-            user_hardware["gpu"].get("vram_gb")
-        )
+    # Step 2: Get game requirements
+    min_reqs = Requirements.from_dict(game_requirements["minimum"])
+    rec_reqs = Requirements.from_dict(game_requirements["recommended"])
     
-    user_ram_gb = user_hardware["ram_gb"]
+    # Step 3: Check recommended requirements
+    cpu_meets_rec = hw.cpu_score >= rec_reqs.cpu_score
+    gpu_meets_rec = hw.gpu_score >= rec_reqs.gpu_score
+    ram_meets_rec = hw.ram_gb >= rec_reqs.ram_gb
     
-    # Step 2: Get game requirements
-    min_reqs = game_requirements["minimum"]
-    rec_reqs = game_requirements["recommended"]
+    # Step 4: Check minimum requirements
+    cpu_meets_min = hw.cpu_score >= min_reqs.cpu_score
+    gpu_meets_min = hw.gpu_score >= min_reqs.gpu_score
+    ram_meets_min = hw.ram_gb >= min_reqs.ram_gb
     
-    # Step 3: Check minimum requirements
-    cpu_meets_min = user_cpu_score >= min_reqs["cpu_score"]
-    gpu_meets_min = user_gpu_score >= min_reqs["gpu_score"]
-    ram_meets_min = user_ram_gb >= min_reqs["ram_gb"]
+    if (cpu_meets_rec and gpu_meets_rec and ram_meets_rec
+            and cpu_meets_min and gpu_meets_min and ram_meets_min):
+        # Common case for high-end rigs: skip the details, table and gap work
+        return Result(True, "High", _HIGH_NOTES, Details(True, True, True, True, True, True, hw))
     
-    # Step 4: Check recommended requirements
-    cpu_meets_rec = user_cpu_score >= rec_reqs["cpu_score"]
-    gpu_meets_rec = user_gpu_score >= rec_reqs["gpu_score"]
-    ram_meets_rec = user_ram_gb >= rec_reqs["ram_gb"]
+    # Shared by every result branch
+    details = Details(
+        cpu_meets_min, cpu_meets_rec,
+        gpu_meets_min, gpu_meets_rec,
+        ram_meets_min, ram_meets_rec,
+        hw
+    )
     
-    # Step 5: Determine if game can run
-    meets_minimum = cpu_meets_min and gpu_meets_min and ram_meets_min
-    meets_recommended = cpu_meets_rec and gpu_meets_rec and ram_meets_rec
+    # Step 5: Look up the failed minimum requirements from the packed checks
+    bottleneck_templates = _BOTTLENECK_TABLE[cpu_meets_min | (gpu_meets_min << 1) | (ram_meets_min << 2)]
     
     # Step 6: Generate result
-    if not meets_minimum:
+    if bottleneck_templates:
         # Cannot run at all
-        bottlenecks = []
-        if not cpu_meets_min:
-            bottlenecks.append(f"CPU (yours: {user_cpu_score}, need: {min_reqs['cpu_score']})")
-        if not gpu_meets_min:
-            bottlenecks.append(f"GPU (yours: {user_gpu_score}, need: {min_reqs['gpu_score']})")
-        if not ram_meets_min:
-            bottlenecks.append(f"RAM (yours: {user_ram_gb}GB, need: {min_reqs['ram_gb']}GB)")
-        
-        return {
-            "can_run": False,
-            "settings": "Cannot Run",
-            "notes": f"Hardware below minimum requirements. Bottlenecks: {', '.join(bottlenecks)}",
-            "details": {
-                "cpu_meets_min": cpu_meets_min,
-                "cpu_meets_rec": cpu_meets_rec,
-                "gpu_meets_min": gpu_meets_min,
-                "gpu_meets_rec": gpu_meets_rec,
-                "ram_meets_min": ram_meets_min,
-                "ram_meets_rec": ram_meets_rec,
-                "user_scores": {
-                    "cpu": user_cpu_score,
-                    "gpu": user_gpu_score,
-                    "ram": user_ram_gb
-                }
-            }
-        }
+        bottlenecks = [template.format(hw, min_reqs) for template in bottleneck_templates]
+        return Result(
+            False, "Cannot Run",
+            f"Hardware below minimum requirements. Bottlenecks: {', '.join(bottlenecks)}",
+            details
+        )
     
-    elif meets_recommended:
-        # Can run on HIGH settings
-        return {
-            "can_run": True,
-            "settings": "High",
-            "notes": "Your hardware meets or exceeds recommended requirements. Enjoy high settings!",
-            "details": {
-                "cpu_meets_min": cpu_meets_min,
-                "cpu_meets_rec": cpu_meets_rec,
-                "gpu_meets_min": gpu_meets_min,
-                "gpu_meets_rec": gpu_meets_rec,
-                "ram_meets_min": ram_meets_min,
-                "ram_meets_rec": ram_meets_rec,
-                "user_scores": {
-                    "cpu": user_cpu_score,
-                    "gpu": user_gpu_score,
-                    "ram": user_ram_gb
-                }
-            }
-        }
+    # Can run but not at recommended (LOW/MEDIUM settings)
+    # Determine LOW vs MEDIUM based on how close to recommended
+    cpu_gap = _gap(hw.cpu_score, min_reqs.cpu_score, rec_reqs.cpu_score)
+    gpu_gap = _gap(hw.gpu_score, min_reqs.gpu_score, rec_reqs.gpu_score)
+    ram_gap = _gap(hw.ram_gb, min_reqs.ram_gb, rec_reqs.ram_gb)
     
-    else:
-        # Can run but not at recommended (LOW/MEDIUM settings)
-        # Determine LOW vs MEDIUM based on how close to recommended
-        cpu_gap = (user_cpu_score - min_reqs["cpu_score"]) / (rec_reqs["cpu_score"] - min_reqs["cpu_score"])
-        gpu_gap = (user_gpu_score - min_reqs["gpu_score"]) / (rec_reqs["gpu_score"] - min_reqs["gpu_score"])
-        ram_gap = (user_ram_gb - min_reqs["ram_gb"]) / (rec_reqs["ram_gb"] - min_reqs["ram_gb"])
-        
-        # Average gap to determine setting tier
-        avg_gap = (cpu_gap + gpu_gap + ram_gap) / 3
-        
-        if avg_gap >= 0.5:
-            settings = "Medium"
-            notes = "Your hardware is between minimum and recommended. Expect medium settings."
-        else:
-            settings = "Low"
-            notes = "Your hardware meets minimum requirements. Expect low settings for smooth gameplay."
-        
-        return {
-            "can_run": True,
-            "settings": settings,
-            "notes": notes,
-            "details": {
-                "cpu_meets_min": cpu_meets_min,
-                "cpu_meets_rec": cpu_meets_rec,
-                "gpu_meets_min": gpu_meets_min,
-                "gpu_meets_rec": gpu_meets_rec,
-                "ram_meets_min": ram_meets_min,
-                "ram_meets_rec": ram_meets_rec,
-                "user_scores": {
-                    "cpu": user_cpu_score,
-                    "gpu": user_gpu_score,
-                    "ram": user_ram_gb
-                }
-            }
-        }
+    # Average gap to determine setting tier
+    avg_gap = (cpu_gap + gpu_gap + ram_gap) / 3
+    
+    if avg_gap >= 0.5:
+        return Result(True, "Medium", _MED_NOTES, details)
+    return Result(True, "Low", _LOW_NOTES, details)
+
+
+# Settings labels indexed by the codes produced by pc_specs_kernels.check_many_nb
+SETTINGS_LABELS = ("Cannot Run", "Low", "Medium", "High")
+
+def check_many(user_scores: Sequence[int], min_arr: "np.ndarray", rec_arr: "np.ndarray") -> Tuple["np.ndarray", "np.ndarray"]:
+    """
+    Check one user's hardware against many games at once.
+    
+    Vectorized equivalent of check_game_compatibility for scoring a rig
+    against a whole catalog, with the same settings precedence (see its
+    docstring). Uses a numba kernel when numba is installed.
+    
+    Args:
+        user_scores: User scores as (cpu_score, gpu_score, ram_gb)
+        min_arr: np.int32 array of shape (N, 3) with minimum
+            (cpu_score, gpu_score, ram_gb) per game
+        rec_arr: np.int32 array of shape (N, 3) with recommended
+            (cpu_score, gpu_score, ram_gb) per game
+    
+    Returns:
+        Tuple (can_run, settings) of arrays of shape (N,):
+            can_run: bool array
+            settings: str array ("Cannot Run", "Low", "Medium", "High")
+    """
+    if np is None:
+        raise ImportError("check_many requires numpy")
+    
+    user = np.asarray(user_scores, dtype=np.int32)
+    min_arr = np.asarray(min_arr, dtype=np.int32)
+    rec_arr = np.asarray(rec_arr, dtype=np.int32)
+    
+    if HAVE_NUMBA:
+        out_settings = np.empty(len(min_arr), dtype=np.int8)
+        out_can_run = np.empty(len(min_arr), dtype=np.bool_)
+        _check_many_nb(user[0], user[1], user[2], min_arr, rec_arr, out_settings, out_can_run)
+        return out_can_run, np.array(SETTINGS_LABELS)[out_settings]
+    
+    meets_min = np.asarray((user >= min_arr).all(axis=1))
+    meets_rec = np.asarray((user >= rec_arr).all(axis=1))
+    
+    # A zero-width range (recommended == minimum) counts as fully met
+    denom = rec_arr - min_arr
+    safe_denom = np.where(denom == 0, 1, denom)
+    gap = np.where(denom == 0, 1.0, (user - min_arr) / safe_denom)
+    avg_gap = gap.mean(axis=1)
+    
+    settings = np.select(
+        [~meets_min, meets_rec, avg_gap >= 0.5],
+        ["Cannot Run", "High", "Medium"],
+        default="Low"
+    )
+    return meets_min, settings
 
 
 # Example usage (for testing)
 if __name__ == "__main__":
     # Example user hardware
-    user_hw = {
+    user_hw: UserHardware = {
         "cpu": {
             "name": "AMD Ryzen 5 5600X",
             "cores": 6,
@@ -336,7 +608,7 @@ if __name__ == "__main__":
     }
     
     # Example game requirements (e.g., Cyberpunk 2077)
-    game_reqs = {
+    game_reqs: GameRequirements = {
         "minimum": {
             "cpu_score": 16000,
             "gpu_score": 9000,
@@ -350,4 +622,4 @@ if __name__ == "__main__":
     }
     
     result = check_game_compatibility(user_hw, game_reqs)
-    print(json.dumps(result, indent=2))
+    print(to_json(result, indent=True))
@@ -0,0 +1,37 @@
+"""
+Numba kernels for pc_specs_checker.
+
+Kept separate from pc_specs_checker so that module can be compiled with
+mypyc while these functions stay plain Python for numba to JIT. Importing
+this module requires numba.
+"""
+
+from numba import njit, prange
+
+
+@njit(cache=True, parallel=True)
+def check_many_nb(user_cpu, user_gpu, user_ram, min_arr, rec_arr, out_settings, out_can_run):
+    """
+    Fill setting codes and can_run flags per game.
+    
+    Setting codes index pc_specs_checker.SETTINGS_LABELS:
+        0 = Cannot Run, 1 = Low, 2 = Medium, 3 = High
+    """
+    for i in prange(min_arr.shape[0]):
+        meets_min = user_cpu >= min_arr[i, 0] and user_gpu >= min_arr[i, 1] and user_ram >= min_arr[i, 2]
+        meets_rec = user_cpu >= rec_arr[i, 0] and user_gpu >= rec_arr[i, 1] and user_ram >= rec_arr[i, 2]
+        out_can_run[i] = meets_min
+        if not meets_min:
+            out_settings[i] = 0
+        elif meets_rec:
+            out_settings[i] = 3
+        else:
+            # A zero-width range (recommended == minimum) is fully met
+            total_gap = 0.0
+            for j, user_score in enumerate((user_cpu, user_gpu, user_ram)):
+                denom = rec_arr[i, j] - min_arr[i, j]
+                total_gap += (user_score - min_arr[i, j]) / denom if denom else 1.0
+            if total_gap / 3 >= 0.5:
+                out_settings[i] = 2
+            else:
+                out_settings[i] = 1